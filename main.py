@@ -1,10 +1,14 @@
 import datetime
+import logging
 
 from onward import Plan, operation
 
 from pydantic_settings import CliPositionalArg
 
 
+logger = logging.getLogger(__name__)
+
+
 class AddUsers(Plan):
     file_name: CliPositionalArg[str]
 
@@ -28,12 +32,12 @@ class FinalLog(AddUsers.State):
 
 @operation
 def test2(a: UploadResults, b: ParseFile) -> FinalLog:
-    print("test2", a, b)
+    logger.debug("test2 %s %s", a, b)
     return FinalLog()
 
 @operation
 def read_file(plan: AddUsers) -> ParseFile:
-    print("read_file", plan)
+    logger.debug("read_file %s", plan)
     return ParseFile(
         percentage=.213,
         finished_at=datetime.datetime.now()
@@ -41,25 +45,25 @@ def read_file(plan: AddUsers) -> ParseFile:
 
 @operation
 def log_file(t: ParseFile) -> None:
-    print("log_file", t)
+    logger.debug("log_file %s", t)
 
 @operation
 def upload_file(results: ParseFile) -> UploadResults:
-    print("upload_file", results)
+    logger.debug("upload_file %s", results)
     return UploadResults(
         data = {"string": "string"}
     )
 
 @operation
 def test1(a: ParseFile) -> SaveResults:
-    print("test1", a)
+    logger.debug("test1 %s", a)
     return SaveResults(
         file_path="File paths"
     )
 
 @operation
 def save_details(results: ParseFile, uploaded: UploadResults, plan: AddUsers) -> None:
-    print("save_details", results, uploaded, plan)
+    logger.debug("save_details %s %s %s", results, uploaded, plan)
 
 
 if __name__ == "__main__":
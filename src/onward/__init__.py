@@ -1,9 +1,8 @@
 from asyncio import iscoroutinefunction
 from collections.abc import Coroutine
 import datetime
-from functools import partial
-from graphlib import TopologicalSorter
 from inspect import isclass
+from types import MappingProxyType
 from typing import Any, Callable, ClassVar, TypeVar, Union, get_type_hints
 from typing_extensions import override
 
@@ -12,17 +11,20 @@ try:
 except ImportError:
     from typing_extensions import Unpack
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from pydantic_settings import (
     BaseSettings,
     PydanticBaseSettingsSource,
 )
 
-from onward.executor import AsyncOperation, Executor, OperationType, ReturnType, SyncOperation, SynchronousExecutor
+from onward.executor import AsyncOperation, Executor, OperationType, ReturnType, SyncCall, SyncOperation, SynchronousExecutor
 from onward.errors import InvalidOperationReturnError, InvalidOperationSignatureError, TooManyProvidersError
+from onward.graph import GraphCursor, OperationGraph
 
 
 class State(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     __onward_plan__: ClassVar[type["Plan"]]
 
     onward_last_completed: datetime.datetime = Field(
@@ -48,9 +50,11 @@ class PlanMeta(type(BaseSettings)):
         **kwargs: Any,  # pyright: ignore[reportExplicitAny, reportAny]
     ) -> type:
         namespace["__onward_operations__"] = {}
-        namespace["__onward_states__"] = {}
+        namespace["__onward_operation_dependencies__"] = {}
+        namespace["__onward_sync_operations__"] = {}
+        namespace["__onward_async_operations__"] = {}
         namespace["__onward_executor__"] = executor() if isclass(executor) else executor
-        namespace["__onward_operation_graph__"] = TopologicalSorter()
+        namespace["__onward_operation_graph__"] = OperationGraph()
 
         plan = super().__new__(
             mcs,
@@ -79,70 +83,89 @@ class Plan(BaseSettings, metaclass=PlanMeta, executor=SynchronousExecutor):
     __onward_operations__: ClassVar[
         dict[Union[type[State], str], "OperationType[State | None]"]
     ]
-    __onward_operation_graph__: "ClassVar[TopologicalSorter[type[State] | str]]"
-    __onward_states__: ClassVar[dict[type[State], State]]
+    # Each operation's dependencies in arguement order, with None standing in for the plan itself.
+    __onward_operation_dependencies__: ClassVar[
+        dict[Union[type[State], str], tuple[Union[type[State], None], ...]]
+    ]
+    __onward_sync_operations__: ClassVar[dict[Union[type[State], str], "SyncOperation[State | None]"]]
+    __onward_async_operations__: ClassVar[dict[Union[type[State], str], "AsyncOperation[State | None]"]]
+    __onward_operation_graph__: "ClassVar[OperationGraph[type[State] | str]]"
     __onward_executor__: ClassVar[Executor]
 
+    # Run progress and results belong to each plan instance, the graph layout is shared by the class.
+    _onward_states: dict[type[State], State] = PrivateAttr(default_factory=dict)
+    _onward_states_view: MappingProxyType[type[State], State] = PrivateAttr()
+    _onward_cursor: "GraphCursor[type[State] | str]" = PrivateAttr()
+
     def __init__(self, **kwargs: Any):  # pyright: ignore[reportExplicitAny, reportAny]
         super().__init__(**kwargs)  # pyright: ignore[reportAny]
 
-        for state, operation in self.__onward_operations__.items():
-            self.__onward_operation_graph__.add(
-                state,
-                *(dep for dep in operation.dependencies if issubclass(dep, State)),
-            )
+        self._onward_states_view = MappingProxyType(self._onward_states)
+        self._onward_cursor = self.__onward_operation_graph__.prepare()
 
-        self.__onward_operation_graph__.prepare()
+    @property
+    def __onward_states_view__(self) -> MappingProxyType[type[State], State]:
+        return self._onward_states_view
 
     def next_operation_group(self) -> tuple[Union[type["State"], str], ...]:
-        return self.__onward_operation_graph__.get_ready()
+        return self._onward_cursor.get_ready()
 
     def get_state_value(self, state_type: type[S]) -> Union[S, None]:
-        return self.__onward_states__.get(state_type)  # pyright: ignore[reportReturnType]
+        return self._onward_states.get(state_type)  # pyright: ignore[reportReturnType]
 
     @property
     def plan_active(self) -> bool:
-        return self.__onward_operation_graph__.is_active()
+        return self._onward_cursor.is_active()
 
     def start_or_resume(self) -> None:
-        while self.plan_active:
-            nodes = self.next_operation_group()
+        executor = self.__onward_executor__
+        states = self._onward_states
+        operations = self.__onward_operations__
+        dependencies = self.__onward_operation_dependencies__
+        sync_operations = self.__onward_sync_operations__
+        async_operations = self.__onward_async_operations__
+        graph = self._onward_cursor
+
+        while graph.is_active():
+            nodes = graph.get_ready()
 
             if not nodes:
-                next_result, next_state = self.__onward_executor__.join_next()
-                if not isinstance(next_state, str):
-                    if next_result is None:
-                        msg = f"returned None when {next_state!r} was expected. Error should have been raised by Operation, so this may be a bug."
-                        raise InvalidOperationReturnError(
-                            self.__onward_operations__[next_state], msg
-                        )
-                    self.__onward_states__[next_state] = next_result
-                self.__onward_operation_graph__.done(next_state)
+                # Collect anything else that finished alongside the operation we waited on,
+                # so the graph is only queried once for the whole batch.
+                finished = [executor.join_next()]
+                finished.extend(executor.try_join_nowait())
+
+                for next_result, next_state in finished:
+                    if not isinstance(next_state, str):
+                        if next_result is None:
+                            msg = f"returned None when {next_state!r} was expected. Error should have been raised by Operation, so this may be a bug."
+                            raise InvalidOperationReturnError(
+                                operations[next_state], msg
+                            )
+                        states[next_state] = next_result
+                    graph.done(next_state)
                 continue
 
-            sync_partials: list[tuple[partial[tuple[ReturnType, Union[type[State], str]]], Union[type[State], str]]] = []
-            async_partials: list[tuple[Coroutine[Any, Any, tuple[ReturnType, Union[type[State], str]]], Union[type[State], str]]] = []  # pyright: ignore[reportExplicitAny]
+            sync_calls: list[tuple[SyncCall, Union[type[State], str]]] = []
+            async_calls: list[tuple[Coroutine[Any, Any, tuple[ReturnType, Union[type[State], str]]], Union[type[State], str]]] = []  # pyright: ignore[reportExplicitAny]
 
             for state in nodes:
-                operation = self.__onward_operations__[state]
                 args = [
-                    (
-                        self.__onward_states__[req_state]
-                        if issubclass(req_state, State)
-                        else self
-                    )
-                    for req_state in operation.dependencies
+                    self if req_state is None else states[req_state]
+                    for req_state in dependencies[state]
                 ]
 
-                if isinstance(operation, AsyncOperation):
-                    async_partials.append((operation(*args), operation.id))
+                async_operation = async_operations.get(state)
+                if async_operation is None:
+                    sync_calls.append((sync_operations[state](*args), state))
                 else:
-                    sync_partials.append((operation(*args), operation.id))
+                    async_calls.append((async_operation(*args), state))
 
-            self.__onward_executor__.add_operations(*sync_partials)
+            if sync_calls:
+                executor.add_operations(*sync_calls)
 
-            if async_partials:
-                self.__onward_executor__.add_async_operations(*async_partials)
+            if async_calls:
+                executor.add_async_operations(*async_calls)
 
 
     @classmethod
@@ -168,12 +191,11 @@ C_or_A = TypeVar("C_or_A", Callable[..., Union[State, None]], Callable[..., Coro
 
 def operation(func: C_or_A) -> C_or_A:
     hints = get_type_hints(func)
-    hint_map: dict[Union[type[State], type[Plan]], str] = {}
 
     if "return" not in hints:
         message = "does not have a typed return value. Operation functions should return a State object or None."
         raise InvalidOperationSignatureError(func, message)
-    elif not issubclass(hints["return"], State) and hints["return"] is not type(None):
+    elif not (isclass(hints["return"]) and issubclass(hints["return"], State)) and hints["return"] is not type(None):
         message = f"has an incorrect typed return value. Operation functions should return a State object or None, '{hints['return']}' declared instead."
         raise InvalidOperationSignatureError(func, message)
 
@@ -194,11 +216,17 @@ def operation(func: C_or_A) -> C_or_A:
         raise InvalidOperationSignatureError(func, message)
 
     for dep_name, dep_state in hints.items():  # pyright: ignore[reportAny]
-        if not issubclass(dep_state, State) and not issubclass(dep_state, Plan):
+        if not isclass(dep_state) or not issubclass(dep_state, (State, Plan)):
             message = f" arguement '{dep_name}' has an invalid type ({dep_state}). Operation arguements should be typed as Plan or State instances."
             raise InvalidOperationSignatureError(func, message)
         depends.append(dep_state)
-        hint_map[dep_state] = dep_name
+
+    # Resolved here so scheduling doesn't need to re-check whether each dependency is a State on every pass.
+    state_dependencies: tuple[Union[type[State], None], ...] = tuple(
+        dep if issubclass(dep, State) else None for dep in depends
+    )
+    # Arguement names in the same order as depends, which is the order arguements are passed in.
+    keyword_names = tuple(hints)
 
     first_arg = depends[0]
     if issubclass(first_arg, State):
@@ -207,9 +235,9 @@ def operation(func: C_or_A) -> C_or_A:
         plan = first_arg
 
     if iscoroutinefunction(func):
-        operation = AsyncOperation(func, depends, provides, hint_map)
+        operation = AsyncOperation(func, depends, provides, keyword_names)
     else:
-        operation = SyncOperation(func, depends, provides, hint_map)  # pyright: ignore[reportArgumentType] be better basedpyright
+        operation = SyncOperation(func, depends, provides, keyword_names)  # pyright: ignore[reportArgumentType] be better basedpyright
 
     if (
         provides in plan.__onward_operations__
@@ -226,5 +254,14 @@ def operation(func: C_or_A) -> C_or_A:
         raise TooManyProvidersError(func, message)
 
     plan.__onward_operations__[operation.id] = operation
+    plan.__onward_operation_dependencies__[operation.id] = state_dependencies
+    plan.__onward_operation_graph__.add(
+        operation.id,
+        *(dep for dep in state_dependencies if dep is not None),
+    )
+    if isinstance(operation, AsyncOperation):
+        plan.__onward_async_operations__[operation.id] = operation
+    else:
+        plan.__onward_sync_operations__[operation.id] = operation
 
     return func  # pyright: ignore[reportReturnType] "iscoroutinefunction" massacres any existing typing on the coroutine :(
@@ -1,11 +1,11 @@
 
 from abc import ABCMeta, abstractmethod
-from asyncio import AbstractEventLoop, Task
+from asyncio import AbstractEventLoop
 import asyncio
-from collections.abc import Awaitable, Coroutine
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from collections import deque
+from collections.abc import Awaitable, Coroutine, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait
 from dataclasses import dataclass, field
-from functools import partial
 from typing import TYPE_CHECKING, Any, Callable, Generic, TypeVar, Union
 from typing_extensions import override
 
@@ -17,32 +17,49 @@ if TYPE_CHECKING:
 ReturnType = Union["State", None]
 
 T = TypeVar("T", bound=ReturnType)
+R = TypeVar("R")
+
+
+def compile_call(function: Callable[..., R], keyword_names: tuple[str, ...]) -> Callable[..., R]:
+    # Generates "def call(a0, a1): return function(plan=a0, first=a1)", so an operation can be called with its
+    # dependencies in order without building and unpacking a kwargs dict every time.
+    parameters = ", ".join(f"a{i}" for i in range(len(keyword_names)))
+    arguements = ", ".join(f"{name}=a{i}" for i, name in enumerate(keyword_names))
+    namespace: dict[str, Any] = {"function": function}  # pyright: ignore[reportExplicitAny]
+    exec(f"def call({parameters}):\n    return function({arguements})", namespace)
+    return namespace["call"]  # pyright: ignore[reportAny]
 
 
 @dataclass
 class SyncOperation(Generic[T]):
+    __slots__ = ("function", "dependencies", "provides", "keyword_names", "_id", "_returns_state", "_call")
+
     function: Callable[..., T]
     dependencies: list[Union[type["State"], type["Plan"]]]
     provides: type[T]
-    hint_map: dict[Union[type["State"], type["Plan"]], str]
+    keyword_names: tuple[str, ...]
 
-    def __call__(self, *args: Union["State", "Plan"]) -> partial[tuple[T, "type[State] | str"]]:
-        return partial(self._operation_wrapper, **{
-                self.hint_map[type(arg)]: arg for arg in args
-        })
+    def __post_init__(self) -> None:
+        self._returns_state: bool = self.provides is not type(None)
+        self._id: "type[State] | str" = self.provides if self._returns_state else self.name
+        self._call = compile_call(self.function, self.keyword_names)
 
-    def _operation_wrapper(self, **kwargs: "State | Plan") -> tuple[T, "type[State] | str"]:
-        state_value = self.function(**kwargs)
+    def __call__(self, *args: Union["State", "Plan"]) -> tuple[Callable[..., tuple[T, "type[State] | str"]], tuple[Union["State", "Plan"], ...]]:
+        return self._operation_wrapper, args
 
-        if self.provides is not type(None):
-            if not isinstance(state_value, self.provides):
+    def _operation_wrapper(self, *args: "State | Plan") -> tuple[T, "type[State] | str"]:
+        state_value = self._call(*args)
+
+        if self._returns_state:
+            # Operations almost always return exactly the promised State, so check identity before isinstance.
+            if type(state_value) is not self.provides and not isinstance(state_value, self.provides):
                 msg = f"promised to return '{self.provides.__name__}', '{state_value}' returned instance."
                 raise InvalidOperationReturnError(self, msg)
             if state_value is None:
                 msg = f"has desynced provide value ({self.provides}). This is either the result of tampering with the Operation object or a bug with onwards."
                 raise InvalidOperationReturnError(self, msg)
 
-        return state_value, self.id
+        return state_value, self._id
 
     @property
     def name(self) -> str:
@@ -50,33 +67,39 @@ class SyncOperation(Generic[T]):
 
     @property
     def id(self) -> "type[State] | str":
-        return self.provides if self.provides is not type(None) else self.name  # pyright: ignore[reportReturnType] basedpyright bug
+        return self._id
 
 
 @dataclass
 class AsyncOperation(Generic[T]):
+    __slots__ = ("function", "dependencies", "provides", "keyword_names", "_id", "_returns_state", "_call")
+
     function: Callable[..., Awaitable[T]]
     dependencies: list[Union[type["State"], type["Plan"]]]
     provides: type[T]
-    hint_map: dict[Union[type["State"], type["Plan"]], str]
+    keyword_names: tuple[str, ...]
+
+    def __post_init__(self) -> None:
+        self._returns_state: bool = self.provides is not type(None)
+        self._id: "type[State] | str" = self.provides if self._returns_state else self.name
+        self._call = compile_call(self.function, self.keyword_names)
 
     def __call__(self, *args: Union["State", "Plan"]) -> Coroutine[Any, Any, tuple[T, "type[State] | str"]]:  # pyright: ignore[reportExplicitAny]
-        return self._operation_wrapper(**{
-                self.hint_map[type(arg)]: arg for arg in args
-        })
+        return self._operation_wrapper(*args)
 
-    async def _operation_wrapper(self, **kwargs: "State | Plan") -> tuple[T, "type[State] | str"]:
-        state_value = await self.function(**kwargs)
+    async def _operation_wrapper(self, *args: "State | Plan") -> tuple[T, "type[State] | str"]:
+        state_value = await self._call(*args)
 
-        if self.provides is not type(None):
-            if not isinstance(state_value, self.provides):
+        if self._returns_state:
+            # Operations almost always return exactly the promised State, so check identity before isinstance.
+            if type(state_value) is not self.provides and not isinstance(state_value, self.provides):
                 msg = f"promised to return '{self.provides.__name__}', '{state_value}' returned instance."
                 raise InvalidOperationReturnError(self, msg)
             if state_value is None:
                 msg = f"has desynced provide value ({self.provides}). This is either the result of tampering with the Operation object or a bug with onwards."
                 raise InvalidOperationReturnError(self, msg)
 
-        return state_value, self.id
+        return state_value, self._id
 
     @property
     def name(self) -> str:
@@ -84,11 +107,12 @@ class AsyncOperation(Generic[T]):
 
     @property
     def id(self) -> "type[State] | str":
-        return self.provides if self.provides is not type(None) else self.name  # pyright: ignore[reportReturnType] basedpyright bug
+        return self._id
 
 
 OperationType = Union[SyncOperation[T], AsyncOperation[T]]
 PartialReturns = tuple[ReturnType, "type[State] | str"]
+SyncCall = tuple[Callable[..., PartialReturns], tuple[Union["State", "Plan"], ...]]
 
 
 class Executor(metaclass=ABCMeta):
@@ -99,7 +123,7 @@ class Executor(metaclass=ABCMeta):
         raise NotImplementedError
 
     @abstractmethod
-    def add_operations(self, *operations: tuple[partial[PartialReturns], "type[State] | str"]) -> None:
+    def add_operations(self, *operations: tuple[SyncCall, "type[State] | str"]) -> None:
         raise NotImplementedError
 
     def add_async_operations(self, *operations: tuple[Coroutine[Any, Any, PartialReturns], "type[State] | str"]) -> None:  # pyright: ignore[reportExplicitAny, reportUnusedParameter]
@@ -109,6 +133,11 @@ class Executor(metaclass=ABCMeta):
     def join_next(self, timeout: Union[int, float, None] = None) -> PartialReturns:
         raise NotImplementedError
 
+    def try_join_nowait(self) -> list[PartialReturns]:
+        # Returns results that are already available without blocking. Operations that failed are left
+        # pending, so their error is raised by the next join_next() and no successful results are lost.
+        return []
+
     @abstractmethod
     def close(self) -> None:
         raise NotImplementedError
@@ -116,7 +145,7 @@ class Executor(metaclass=ABCMeta):
 
 @dataclass
 class SynchronousExecutor(Executor):
-    schedule: list[partial[PartialReturns]] = field(default_factory=list)
+    schedule: deque[SyncCall] = field(default_factory=deque)
 
     @property
     @override
@@ -124,15 +153,16 @@ class SynchronousExecutor(Executor):
         return len(self.schedule) > 0
 
     @override
-    def add_operations(self, *operations: tuple[partial[PartialReturns], "type[State] | str"]) -> None:
-        self.schedule += [o[0] for o in operations]
+    def add_operations(self, *operations: tuple[SyncCall, "type[State] | str"]) -> None:
+        self.schedule.extend(o[0] for o in operations)
 
     @override
     def join_next(self, timeout: Union[int, float, None] = None) -> PartialReturns:
         if not self.running:
             raise NotRunningError(self)
 
-        return self.schedule.pop()()
+        function, args = self.schedule.popleft()
+        return function(*args)
 
     @override
     def close(self) -> None:
@@ -141,13 +171,13 @@ class SynchronousExecutor(Executor):
 
 class ThreadedExecutor(Executor):
     pool: ThreadPoolExecutor
-    futures: list[Future[PartialReturns]]
+    futures: set[Future[PartialReturns]]
 
     def __init__(self, max_workers: Union[None, int] = None) -> None:
         self.pool = ThreadPoolExecutor(
             max_workers=max_workers
         )
-        self.futures = []
+        self.futures = set()
 
         super().__init__()
 
@@ -156,22 +186,39 @@ class ThreadedExecutor(Executor):
     def running(self) -> bool:
         return len(self.futures) > 0
 
+    def submit_batch(self, calls: Iterable[SyncCall]) -> None:
+        submit = self.pool.submit
+        self.futures.update(submit(function, *args) for function, args in calls)
+
     @override
-    def add_operations(self, *operations: tuple[partial[PartialReturns], "type[State] | str"]) -> None:
-        for operation in operations:
-            self.futures.append(
-                self.pool.submit(operation[0])
-            )
+    def add_operations(self, *operations: tuple[SyncCall, "type[State] | str"]) -> None:
+        self.submit_batch(operation[0] for operation in operations)
 
     @override
     def join_next(self, timeout: Union[int, float, None] = None) -> PartialReturns:
         if not self.running:
             raise NotRunningError(self)
 
-        next_future = next(as_completed(self.futures, timeout=timeout))
-        self.futures.remove(next_future)
+        done, _ = wait(self.futures, timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            raise FuturesTimeoutError(f"{len(self.futures)} operations unfinished after {timeout} seconds.")
+
+        next_future = done.pop()
+        self.futures.discard(next_future)
         return next_future.result()
 
+    @override
+    def try_join_nowait(self) -> list[PartialReturns]:
+        return_values: list[PartialReturns] = []
+        for future in [future for future in self.futures if future.done()]:
+            if future.cancelled() or future.exception() is not None:
+                continue
+
+            return_values.append(future.result())
+            self.futures.discard(future)
+
+        return return_values
+
     @override
     def close(self) -> None:
         self.pool.shutdown(cancel_futures=True)
@@ -182,13 +229,19 @@ TA = TypeVar("TA", bound=PartialReturns)
 
 
 class AsyncioExecutor(Executor):
-    tasks: dict["type[State] | str", Task[PartialReturns]]
+    tasks: dict["type[State] | str", asyncio.Future[PartialReturns]]
+    completed: deque[asyncio.Future[PartialReturns]]
     loop: AbstractEventLoop
     thread_sync: bool
+    pool: ThreadPoolExecutor
+    _waiter: Union[asyncio.Future[None], None]
 
     def __init__(self, loop: Union[AbstractEventLoop, None] = None, thread_sync: bool = False) -> None:
         self.tasks = {}
+        self.completed = deque()
         self.thread_sync = thread_sync
+        self.pool = ThreadPoolExecutor()
+        self._waiter = None
 
         if loop is None:
             self.loop = asyncio.new_event_loop()
@@ -204,42 +257,76 @@ class AsyncioExecutor(Executor):
         return len(self.tasks) > 0 or self.loop.is_closed()
 
     @staticmethod
-    async def async_wrap(operation: partial[TA]) -> TA:
-        return operation.func(*operation.args, **operation.keywords)
+    async def async_wrap(function: Callable[..., TA], args: tuple[Union["State", "Plan"], ...]) -> TA:
+        return function(*args)
+
+    def _schedule(self, state: "type[State] | str", task: asyncio.Future[PartialReturns]) -> None:
+        task.add_done_callback(self._task_done)
+        self.tasks[state] = task
+
+    def _task_done(self, task: asyncio.Future[PartialReturns]) -> None:
+        self.completed.append(task)
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
 
     @override
-    def add_operations(self, *operations: tuple[partial[PartialReturns], "type[State] | str"]) -> None:
+    def add_operations(self, *operations: tuple[SyncCall, "type[State] | str"]) -> None:
         if self.thread_sync:
+            # run_in_executor on a shared pool, rather than asyncio.to_thread, which copies the context for every call.
             for operation in operations:
-                self.tasks[operation[1]] = \
-                    self.loop.create_task(
-                        asyncio.to_thread(operation[0].func, *operation[0].args, **operation[0].keywords)
-                    )
+                function, args = operation[0]
+                self._schedule(operation[1], self.loop.run_in_executor(self.pool, function, *args))
         else:
             for operation in operations:
-                self.tasks[operation[1]] = \
-                    self.loop.create_task(self.async_wrap(operation[0]))
+                self._schedule(operation[1], self.loop.create_task(self.async_wrap(*operation[0])))
 
     @override
     def add_async_operations(self, *operations: tuple[Coroutine[Any, Any, PartialReturns], "type[State] | str"]) -> None:  # pyright: ignore[reportExplicitAny]
         for operation in operations:
-            self.tasks[operation[1]] = \
-                self.loop.create_task(operation[0])
+            self._schedule(operation[1], self.loop.create_task(operation[0]))
 
     @override
     def join_next(self, timeout: Union[int, float, None] = None) -> PartialReturns:
         if not self.running:
             raise NotRunningError(self)
 
-        next_task = next(asyncio.as_completed(self.tasks.values()))
-        return_value = self.loop.run_until_complete(next_task)
+        if not self.completed:
+            self._waiter = self.loop.create_future()
+            try:
+                self.loop.run_until_complete(self._waiter)
+            finally:
+                self._waiter = None
+
+        task = self.completed.popleft()
+        if task.cancelled() or task.exception() is not None:
+            # Failed operations can't report their state, so find it to stop tracking the task before raising.
+            del self.tasks[next(state for state, pending in self.tasks.items() if pending is task)]
+
+        return_value = task.result()
         del self.tasks[return_value[1]]
         return return_value
 
+    @override
+    def try_join_nowait(self) -> list[PartialReturns]:
+        return_values: list[PartialReturns] = []
+        while self.completed:
+            task = self.completed[0]
+            if task.cancelled() or task.exception() is not None:
+                break
+
+            return_value = self.completed.popleft().result()
+            del self.tasks[return_value[1]]
+            return_values.append(return_value)
+
+        return return_values
+
 
     @override
     def close(self) -> None:
         for task in self.tasks.values():
+            task.remove_done_callback(self._task_done)
             _ = task.cancel(f"{self.__class__!r} is ending execution of tasks.")
 
         self.tasks.clear()
+        self.completed.clear()
+        self.pool.shutdown(cancel_futures=True)
@@ -0,0 +1,139 @@
+from collections import deque
+from collections.abc import Hashable
+from graphlib import CycleError
+from typing import Generic, TypeVar
+
+N = TypeVar("N", bound=Hashable)
+
+# Per-node progress, mirroring the checks TopologicalSorter.done() makes.
+WAITING = 0
+PASSED_OUT = 1
+DONE = 2
+
+
+class OperationGraph(Generic[N]):
+    predecessors: dict[N, list[N]]
+    nodes: list[N]
+    index: dict[N, int]
+    successors: tuple[tuple[int, ...], ...]
+    initial_indegree: tuple[int, ...]
+    initial_ready: tuple[int, ...]
+    compiled: bool
+
+    def __init__(self) -> None:
+        self.predecessors = {}
+        self.nodes = []
+        self.index = {}
+        self.successors = ()
+        self.initial_indegree = ()
+        self.initial_ready = ()
+        self.compiled = False
+
+    def add(self, node: N, *predecessors: N) -> None:
+        self.predecessors.setdefault(node, []).extend(predecessors)
+        for predecessor in predecessors:
+            _ = self.predecessors.setdefault(predecessor, [])
+
+        self.compiled = False
+
+    def prepare(self) -> "GraphCursor[N]":
+        # The layout only changes when nodes are added, so it is built once and shared by
+        # every cursor. Each cursor gets its own counters, copied from the stored template.
+        if not self.compiled:
+            self._compile()
+
+        return GraphCursor(self)
+
+    def _compile(self) -> None:
+        nodes = list(self.predecessors)
+        index = {node: i for i, node in enumerate(nodes)}
+        successors: list[list[int]] = [[] for _ in nodes]
+        indegree = [0] * len(nodes)
+
+        for node, predecessors in self.predecessors.items():
+            node_id = index[node]
+            for predecessor in predecessors:
+                successors[index[predecessor]].append(node_id)
+                indegree[node_id] += 1
+
+        self._check_for_cycles(nodes, successors, indegree)
+
+        self.nodes = nodes
+        self.index = index
+        self.successors = tuple(tuple(node_successors) for node_successors in successors)
+        self.initial_indegree = tuple(indegree)
+        self.initial_ready = tuple(i for i, degree in enumerate(indegree) if degree == 0)
+        self.compiled = True
+
+    @staticmethod
+    def _check_for_cycles(nodes: list[N], successors: list[list[int]], indegree: list[int]) -> None:
+        indegree = indegree.copy()
+        stack = [i for i, degree in enumerate(indegree) if degree == 0]
+        visited = 0
+
+        while stack:
+            node_id = stack.pop()
+            visited += 1
+            for successor in successors[node_id]:
+                indegree[successor] -= 1
+                if indegree[successor] == 0:
+                    stack.append(successor)
+
+        if visited != len(nodes):
+            cycle = [nodes[i] for i, degree in enumerate(indegree) if degree > 0]
+            raise CycleError("nodes are in a cycle", cycle)
+
+
+class GraphCursor(Generic[N]):
+    nodes: list[N]
+    index: dict[N, int]
+    successors: tuple[tuple[int, ...], ...]
+    indegree: list[int]
+    ready: deque[int]
+    status: list[int]
+    remaining: int
+
+    def __init__(self, graph: OperationGraph[N]) -> None:
+        # The graph replaces these rather than mutating them when it recompiles,
+        # so a cursor keeps the layout it was prepared with.
+        self.nodes = graph.nodes
+        self.index = graph.index
+        self.successors = graph.successors
+        self.indegree = list(graph.initial_indegree)
+        self.ready = deque(graph.initial_ready)
+        self.status = [WAITING] * len(graph.nodes)
+        self.remaining = len(graph.nodes)
+
+    def get_ready(self) -> tuple[N, ...]:
+        nodes = self.nodes
+        status = self.status
+        for i in self.ready:
+            status[i] = PASSED_OUT
+
+        ready = tuple(nodes[i] for i in self.ready)
+        self.ready.clear()
+        return ready
+
+    def is_active(self) -> bool:
+        return self.remaining > 0
+
+    def done(self, *nodes: N) -> None:
+        indegree = self.indegree
+        ready = self.ready
+        status = self.status
+
+        for node in nodes:
+            node_id = self.index.get(node)
+            if node_id is None:
+                raise ValueError(f"node {node!r} was not added using add()")
+            if status[node_id] == DONE:
+                raise ValueError(f"node {node!r} was already marked done")
+            if status[node_id] != PASSED_OUT:
+                raise ValueError(f"node {node!r} was not passed out (still not ready)")
+
+            status[node_id] = DONE
+            self.remaining -= 1
+            for successor in self.successors[node_id]:
+                indegree[successor] -= 1
+                if indegree[successor] == 0:
+                    ready.append(successor)
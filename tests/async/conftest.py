@@ -1,10 +1,11 @@
 from collections.abc import Generator
+from functools import partial
 from onward.executor import AsyncioExecutor, Executor
 
 import pytest
 
 
-@pytest.fixture(scope="function", params=[AsyncioExecutor])
+@pytest.fixture(scope="function", params=[AsyncioExecutor, partial(AsyncioExecutor, thread_sync=True)])
 def executor(request) -> Generator[Executor]:  # pyright: ignore[reportUnknownParameterType, reportMissingParameterType]
 	executor: Executor = request.param()  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
 	yield executor
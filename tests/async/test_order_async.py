@@ -144,3 +144,57 @@ def test_simple_run(executor: Executor) -> None:
 	assert fifth_state.receivers == []
 
 	assert simple_plan.get_state_value(UnusedState) is None
+
+
+def test_mixed_run(executor: Executor) -> None:
+
+	class MixedOrder(Plan, executor=executor):
+		tracker: list[str] = Field(default_factory=list)
+
+
+	class RootState(MixedOrder.State):
+		pass
+
+
+	class LeftState(MixedOrder.State):
+		provider: str
+
+
+	class RightState(MixedOrder.State):
+		provider: str
+
+
+	@operation
+	async def root(plan: MixedOrder) -> RootState:
+		plan.tracker.append("root")
+		return RootState()
+
+	@operation
+	def left(plan: MixedOrder, root: RootState) -> LeftState:
+		plan.tracker.append("left")
+		return LeftState(provider="left")
+
+	@operation
+	def right(plan: MixedOrder, root: RootState) -> RightState:
+		plan.tracker.append("right")
+		return RightState(provider="right")
+
+	@operation
+	async def join(plan: MixedOrder, left: LeftState, right: RightState) -> None:
+		plan.tracker.append("join")
+
+
+	mixed_plan = MixedOrder()
+	mixed_plan.start_or_resume()
+
+	assert mixed_plan.tracker[0] == "root"
+	assert sorted(mixed_plan.tracker[1:3]) == ["left", "right"]
+	assert mixed_plan.tracker[3] == "join"
+
+	left_state = mixed_plan.get_state_value(LeftState)
+	assert left_state
+	assert left_state.provider == "left"
+
+	right_state = mixed_plan.get_state_value(RightState)
+	assert right_state
+	assert right_state.provider == "right"
@@ -0,0 +1,61 @@
+from concurrent.futures import wait
+
+from onward.executor import AsyncioExecutor, ThreadedExecutor
+
+import pytest
+
+
+def test_threaded_drain_keeps_failed_operation_pending() -> None:
+	executor = ThreadedExecutor()
+
+	def succeed(name: str) -> tuple[None, str]:
+		return None, name
+
+	def fail() -> tuple[None, str]:
+		raise ValueError("failed")
+
+	try:
+		executor.add_operations(
+			((succeed, ("first",)), "first"),
+			((fail, ()), "failing"),
+			((succeed, ("last",)), "last"),
+		)
+		_ = wait(executor.futures)
+
+		assert sorted(executor.try_join_nowait()) == [(None, "first"), (None, "last")]
+		assert len(executor.futures) == 1
+		assert executor.try_join_nowait() == []
+
+		with pytest.raises(ValueError):
+			_ = executor.join_next()
+	finally:
+		executor.close()
+
+
+def test_asyncio_drain_keeps_failed_operation_pending() -> None:
+	executor = AsyncioExecutor()
+
+	async def succeed(name: str) -> tuple[None, str]:
+		return None, name
+
+	async def fail() -> tuple[None, str]:
+		raise ValueError("failed")
+
+	try:
+		executor.add_async_operations(
+			(succeed("first"), "first"),
+			(fail(), "failing"),
+			(succeed("last"), "last"),
+		)
+
+		assert executor.join_next() == (None, "first")
+		assert executor.try_join_nowait() == []
+		assert "last" in executor.tasks
+
+		with pytest.raises(ValueError):
+			_ = executor.join_next()
+
+		assert executor.try_join_nowait() == [(None, "last")]
+		assert not executor.running
+	finally:
+		executor.close()
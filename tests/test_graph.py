@@ -0,0 +1,84 @@
+from graphlib import CycleError
+
+from onward.graph import OperationGraph
+
+import pytest
+
+
+def test_graph_order() -> None:
+	graph: OperationGraph[str] = OperationGraph()
+	graph.add("second", "first")
+	graph.add("third", "first", "second")
+	graph.add("fourth", "first")
+	cursor = graph.prepare()
+
+	assert cursor.is_active()
+	assert cursor.get_ready() == ("first",)
+	assert cursor.get_ready() == ()
+
+	cursor.done("first")
+	assert set(cursor.get_ready()) == {"second", "fourth"}
+
+	cursor.done("fourth")
+	assert cursor.get_ready() == ()
+
+	cursor.done("second")
+	assert cursor.get_ready() == ("third",)
+	assert cursor.is_active()
+
+	cursor.done("third")
+	assert not cursor.is_active()
+
+
+def test_graph_cycle() -> None:
+	graph: OperationGraph[str] = OperationGraph()
+	graph.add("first", "second")
+	graph.add("second", "first")
+
+	with pytest.raises(CycleError):
+		_ = graph.prepare()
+
+
+def test_graph_cursors_are_independent() -> None:
+	graph: OperationGraph[str] = OperationGraph()
+	graph.add("second", "first")
+	first_cursor = graph.prepare()
+	second_cursor = graph.prepare()
+
+	first_cursor.done(*first_cursor.get_ready())
+	first_cursor.done(*first_cursor.get_ready())
+	assert not first_cursor.is_active()
+
+	assert second_cursor.is_active()
+	assert second_cursor.get_ready() == ("first",)
+
+	graph.add("third", "second")
+	third_cursor = graph.prepare()
+	third_cursor.done(*third_cursor.get_ready())
+	third_cursor.done(*third_cursor.get_ready())
+	assert third_cursor.get_ready() == ("third",)
+
+	second_cursor.done("first")
+	assert second_cursor.get_ready() == ("second",)
+	second_cursor.done("second")
+	assert not second_cursor.is_active()
+
+
+def test_graph_done_checks_node() -> None:
+	graph: OperationGraph[str] = OperationGraph()
+	graph.add("second", "first")
+	cursor = graph.prepare()
+
+	with pytest.raises(ValueError):
+		cursor.done("first")
+
+	assert cursor.get_ready() == ("first",)
+	cursor.done("first")
+
+	with pytest.raises(ValueError):
+		cursor.done("first")
+	with pytest.raises(ValueError):
+		cursor.done("missing")
+
+	assert cursor.is_active()
+	assert cursor.get_ready() == ("second",)
@@ -1,6 +1,11 @@
+from typing import Union
+
 from pydantic import Field
 from onward import Plan, operation
-from onward.executor import Executor
+from onward.errors import InvalidOperationReturnError, InvalidOperationSignatureError
+from onward.executor import AsyncioExecutor, Executor, SynchronousExecutor
+
+import pytest
 
 
 def test_simple_run(executor: Executor) -> None:
@@ -144,3 +149,300 @@ def test_simple_run(executor: Executor) -> None:
 	assert fifth_state.receivers == []
 
 	assert simple_plan.get_state_value(UnusedState) is None
+
+
+def test_synchronous_sibling_order() -> None:
+
+	class SiblingOrder(Plan, executor=SynchronousExecutor()):
+		tracker: list[str] = Field(default_factory=list)
+
+
+	class RootState(SiblingOrder.State):
+		pass
+
+
+	@operation
+	def root(plan: SiblingOrder) -> RootState:
+		plan.tracker.append("root")
+		return RootState()
+
+	@operation
+	def first(plan: SiblingOrder, root: RootState) -> None:
+		plan.tracker.append("first")
+
+	@operation
+	def second(plan: SiblingOrder, root: RootState) -> None:
+		plan.tracker.append("second")
+
+	@operation
+	def third(plan: SiblingOrder, root: RootState) -> None:
+		plan.tracker.append("third")
+
+
+	sibling_plan = SiblingOrder()
+	sibling_plan.start_or_resume()
+
+	# Operations that become ready together run in the order they were registered.
+	assert sibling_plan.tracker == ["root", "first", "second", "third"]
+
+
+def test_fan_out_run(executor: Executor) -> None:
+
+	class FanOutOrder(Plan, executor=executor):
+		tracker: list[str] = Field(default_factory=list)
+
+
+	class RootState(FanOutOrder.State):
+		pass
+
+
+	class LeftState(FanOutOrder.State):
+		pass
+
+
+	class MiddleState(FanOutOrder.State):
+		pass
+
+
+	class RightState(FanOutOrder.State):
+		pass
+
+
+	@operation
+	def root(plan: FanOutOrder) -> RootState:
+		plan.tracker.append("root")
+		return RootState()
+
+	@operation
+	def left(plan: FanOutOrder, root: RootState) -> LeftState:
+		plan.tracker.append("left")
+		return LeftState()
+
+	@operation
+	def middle(plan: FanOutOrder, root: RootState) -> MiddleState:
+		plan.tracker.append("middle")
+		return MiddleState()
+
+	@operation
+	def right(plan: FanOutOrder, root: RootState) -> RightState:
+		plan.tracker.append("right")
+		return RightState()
+
+	@operation
+	def join(plan: FanOutOrder, left: LeftState, middle: MiddleState, right: RightState) -> None:
+		plan.tracker.append("join")
+
+
+	fan_out_plan = FanOutOrder()
+	fan_out_plan.start_or_resume()
+
+	assert fan_out_plan.tracker[0] == "root"
+	assert sorted(fan_out_plan.tracker[1:4]) == ["left", "middle", "right"]
+	assert fan_out_plan.tracker[4] == "join"
+
+	assert fan_out_plan.get_state_value(LeftState)
+	assert fan_out_plan.get_state_value(MiddleState)
+	assert fan_out_plan.get_state_value(RightState)
+
+	states_view = fan_out_plan.__onward_states_view__
+	assert states_view is fan_out_plan.__onward_states_view__
+	assert states_view[LeftState] is fan_out_plan.get_state_value(LeftState)
+
+
+def test_separate_plan_instances(executor: Executor) -> None:
+
+	class RepeatOrder(Plan, executor=executor):
+		name: str
+		tracker: list[str] = Field(default_factory=list)
+
+
+	class NamedState(RepeatOrder.State):
+		name: str
+
+
+	@operation
+	def name_state(plan: RepeatOrder) -> NamedState:
+		plan.tracker.append("name_state")
+		return NamedState(name=plan.name)
+
+	@operation
+	def check_state(plan: RepeatOrder, named: NamedState) -> None:
+		plan.tracker.append(f"check_state {named.name}")
+
+
+	first_plan = RepeatOrder(name="first")
+	second_plan = RepeatOrder(name="second")
+
+	first_plan.start_or_resume()
+	assert first_plan.tracker == ["name_state", "check_state first"]
+	assert second_plan.get_state_value(NamedState) is None
+
+	first_state = first_plan.get_state_value(NamedState)
+	assert first_state
+	assert first_state.name == "first"
+
+	second_plan.start_or_resume()
+	assert second_plan.tracker == ["name_state", "check_state second"]
+
+	second_state = second_plan.get_state_value(NamedState)
+	assert second_state
+	assert second_state.name == "second"
+
+	assert first_plan.get_state_value(NamedState) is first_state
+	assert first_plan.__onward_states_view__ is not second_plan.__onward_states_view__
+
+
+def test_operation_return_checks(executor: Executor) -> None:
+
+	class SubclassOrder(Plan, executor=executor):
+		pass
+
+
+	class PromisedState(SubclassOrder.State):
+		pass
+
+
+	class ExtendedState(PromisedState):
+		pass
+
+
+	@operation
+	def extended(plan: SubclassOrder) -> PromisedState:
+		return ExtendedState()
+
+
+	subclass_plan = SubclassOrder()
+	subclass_plan.start_or_resume()
+	assert type(subclass_plan.get_state_value(PromisedState)) is ExtendedState
+
+
+	class WrongStateOrder(Plan, executor=executor):
+		pass
+
+
+	class ExpectedState(WrongStateOrder.State):
+		pass
+
+
+	class OtherState(WrongStateOrder.State):
+		pass
+
+
+	@operation
+	def wrong_state(plan: WrongStateOrder) -> ExpectedState:
+		return OtherState()  # pyright: ignore[reportReturnType]
+
+
+	with pytest.raises(InvalidOperationReturnError):
+		WrongStateOrder().start_or_resume()
+
+
+	class NoneOrder(Plan, executor=executor):
+		pass
+
+
+	class MissingState(NoneOrder.State):
+		pass
+
+
+	@operation
+	def missing_state(plan: NoneOrder) -> MissingState:
+		return None  # pyright: ignore[reportReturnType]
+
+
+	with pytest.raises(InvalidOperationReturnError):
+		NoneOrder().start_or_resume()
+
+
+def test_async_operation_return_checks() -> None:
+	executor = AsyncioExecutor()
+
+	class SubclassOrder(Plan, executor=executor):
+		pass
+
+
+	class PromisedState(SubclassOrder.State):
+		pass
+
+
+	class ExtendedState(PromisedState):
+		pass
+
+
+	@operation
+	async def extended(plan: SubclassOrder) -> PromisedState:
+		return ExtendedState()
+
+
+	class WrongStateOrder(Plan, executor=executor):
+		pass
+
+
+	class ExpectedState(WrongStateOrder.State):
+		pass
+
+
+	class OtherState(WrongStateOrder.State):
+		pass
+
+
+	@operation
+	async def wrong_state(plan: WrongStateOrder) -> ExpectedState:
+		return OtherState()  # pyright: ignore[reportReturnType]
+
+
+	class NoneOrder(Plan, executor=executor):
+		pass
+
+
+	class MissingState(NoneOrder.State):
+		pass
+
+
+	@operation
+	async def missing_state(plan: NoneOrder) -> MissingState:
+		return None  # pyright: ignore[reportReturnType]
+
+
+	try:
+		subclass_plan = SubclassOrder()
+		subclass_plan.start_or_resume()
+		assert type(subclass_plan.get_state_value(PromisedState)) is ExtendedState
+
+		with pytest.raises(InvalidOperationReturnError):
+			WrongStateOrder().start_or_resume()
+
+		with pytest.raises(InvalidOperationReturnError):
+			NoneOrder().start_or_resume()
+	finally:
+		executor.close()
+
+
+def test_invalid_operation_signatures() -> None:
+
+	class SignatureOrder(Plan):
+		pass
+
+
+	class KnownState(SignatureOrder.State):
+		pass
+
+
+	def optional_arguement(plan: SignatureOrder, known: Union[KnownState, None]) -> None:
+		pass
+
+	def list_arguement(plan: SignatureOrder, known: list) -> None:  # pyright: ignore[reportMissingTypeArgument]
+		pass
+
+	def optional_return(plan: SignatureOrder) -> Union[KnownState, None]:
+		pass
+
+
+	with pytest.raises(InvalidOperationSignatureError):
+		_ = operation(optional_arguement)
+
+	with pytest.raises(InvalidOperationSignatureError):
+		_ = operation(list_arguement)
+
+	with pytest.raises(InvalidOperationSignatureError):
+		_ = operation(optional_return)
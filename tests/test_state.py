@@ -0,0 +1,34 @@
+from pydantic import ValidationError
+from onward import Plan
+
+import pytest
+
+
+def test_state_config() -> None:
+
+	class ConfigOrder(Plan):
+		pass
+
+
+	class FrozenState(ConfigOrder.State):
+		value: int
+
+
+	class MutableState(ConfigOrder.State, frozen=False):
+		value: int
+
+
+	frozen_state = FrozenState(value=1)
+	with pytest.raises(ValidationError):
+		frozen_state.value = 2
+	assert frozen_state.value == 1
+
+	with pytest.raises(ValidationError):
+		_ = FrozenState(value=1, unknown=2)  # pyright: ignore[reportCallIssue]
+
+	mutable_state = MutableState(value=1)
+	mutable_state.value = 2
+	assert mutable_state.value == 2
+
+	with pytest.raises(ValidationError):
+		_ = MutableState(value=1, unknown=2)  # pyright: ignore[reportCallIssue]